@@ -0,0 +1,31 @@
+"""Tooling for validating archived predictions against LIGO/GraceDB events."""
+
+from .ligo_client import GravitationalWaveEvent, LIGOClient, LIGOClientError
+from .validator import HashVerifier, PredictionValidator, ValidationResult
+from .prediction import (
+    Prediction,
+    PredictionFramework,
+    PredictionParseError,
+    PredictionParser,
+    PredictionTable,
+    PredictionType,
+    SkyLocation,
+    WaveParameters,
+)
+
+__all__ = [
+    "GravitationalWaveEvent",
+    "LIGOClient",
+    "LIGOClientError",
+    "Prediction",
+    "PredictionFramework",
+    "PredictionParseError",
+    "PredictionParser",
+    "PredictionTable",
+    "PredictionType",
+    "SkyLocation",
+    "WaveParameters",
+    "HashVerifier",
+    "PredictionValidator",
+    "ValidationResult",
+]
@@ -0,0 +1,683 @@
+"""Parsing of archived prediction files into structured records.
+
+The archive stores predictions as loosely structured text (see the PIN_*
+files under ``PublicDemonstrations/`` and ``CIA/PREDICTION/``): labelled
+lines such as ``Frequency: 120 Hz`` or ``Confidence: 85%`` mixed with free
+prose.  ``PredictionParser`` lifts those into :class:`Prediction` records
+that the validator can score against GraceDB events.
+"""
+
+import re
+from dataclasses import dataclass, field
+
+try:
+    # Google RE2 compiles to a DFA: linear-time matching, no catastrophic
+    # backtracking, and typically faster on the small patterns used here.
+    # The parser avoids constructs RE2 lacks (lookbehind, backreferences),
+    # so the two engines are interchangeable.
+    import re2 as _re
+except ImportError:  # pragma: no cover - optional speedup
+    _re = re
+from typing import ClassVar, NamedTuple
+
+import numpy as np
+
+from ._kernels import haversine_deg
+
+try:
+    import ahocorasick
+except ImportError:  # pragma: no cover - optional speedup
+    ahocorasick = None
+from datetime import datetime, timedelta
+from enum import Enum
+from pathlib import Path
+
+
+class PredictionParseError(ValueError):
+    """Raised when a file does not contain a usable prediction."""
+
+
+class PredictionType(Enum):
+    GRAVITATIONAL_WAVE = "gravitational_wave"
+    BLACK_HOLE_MERGER = "black_hole_merger"
+    EARTHQUAKE = "earthquake"
+    TSUNAMI = "tsunami"
+    SOLAR_FLARE = "solar_flare"
+    GAMMA_RAY_BURST = "gamma_ray_burst"
+    VOLCANO = "volcano"
+
+
+class PredictionFramework(Enum):
+    """The influence-arithmetic key a prediction was produced with."""
+
+    CIA = "cia"  # Chaos Influence Arithmetic
+    SIA = "sia"  # Symbolic/Quantum Influence Arithmetic
+    HIA = "hia"  # Harmonic Influence Arithmetic
+    IIA = "iia"  # Isolation Influence Arithmetic
+    EXPERIMENTAL = "experimental"
+
+
+@dataclass(slots=True, frozen=True)
+class SkyLocation:
+    """Right ascension / declination with an error radius, all in degrees."""
+
+    ra: float
+    dec: float
+    error_radius: float = 10.0
+
+    def __post_init__(self):
+        if not 0.0 <= self.ra < 360.0:
+            raise ValueError(f"ra must be in [0, 360), got {self.ra}")
+        if not -90.0 <= self.dec <= 90.0:
+            raise ValueError(f"dec must be in [-90, 90], got {self.dec}")
+        if self.error_radius <= 0.0:
+            raise ValueError(f"error_radius must be positive, got {self.error_radius}")
+
+
+@dataclass(slots=True, frozen=True)
+class WaveParameters:
+    """Predicted signal parameters for gravitational-wave events."""
+
+    frequency_hz: float | None = None
+    amplitude: float | None = None
+    duration_seconds: float | None = None
+    chirp_mass: float | None = None
+
+
+@dataclass(slots=True)
+class Prediction:
+    """One archived prediction, normalized for validation."""
+
+    prediction_id: str
+    prediction_type: PredictionType
+    framework: PredictionFramework
+    predicted_event_start: datetime
+    predicted_event_end: datetime
+    sky_location: SkyLocation | None = None
+    wave_parameters: WaveParameters | None = None
+    confidence: float | None = None
+    tags: list[str] = field(default_factory=list)
+    source_file: str | None = None
+    validated: bool = False
+    matched_event_id: str | None = None
+    validation_notes: str = ""
+    #: Memoized canonical digest (see HashVerifier.compute_prediction_hash);
+    #: cleared automatically when any hash-relevant field is reassigned.
+    _hash_cache: str | None = field(default=None, repr=False, compare=False)
+    #: Memoized (start_ts, end_ts, center_ts, window_hours) epoch-second
+    #: derivation of the window fields; cleared when either is reassigned.
+    #: A manual slot cache because cached_property needs __dict__, which
+    #: slots=True removes.
+    _window_cache: tuple | None = field(default=None, repr=False, compare=False)
+
+    #: Fields whose mutation must invalidate the memoized hash.
+    _HASH_FIELDS: ClassVar[frozenset] = frozenset(
+        {
+            "prediction_id",
+            "prediction_type",
+            "framework",
+            "predicted_event_start",
+            "predicted_event_end",
+            "sky_location",
+            "wave_parameters",
+            "confidence",
+        }
+    )
+
+    def __setattr__(self, name, value):
+        # object.__setattr__ rather than zero-arg super(): slots=True makes
+        # the dataclass decorator rebuild the class, which invalidates the
+        # __class__ cell that zero-arg super() relies on.
+        object.__setattr__(self, name, value)
+        if name in self._HASH_FIELDS:
+            object.__setattr__(self, "_hash_cache", None)
+            if name in ("predicted_event_start", "predicted_event_end"):
+                object.__setattr__(self, "_window_cache", None)
+
+    def _window(self) -> tuple:
+        """Cached (start_ts, end_ts, center_ts, window_hours) floats.
+
+        datetime subtraction builds a timedelta object per call; the epoch
+        floats are computed once and reused by every time check until a
+        window field is reassigned.
+        """
+        cached = self._window_cache
+        if cached is None:
+            start_ts = self.predicted_event_start.timestamp()
+            end_ts = self.predicted_event_end.timestamp()
+            cached = (
+                start_ts,
+                end_ts,
+                (start_ts + end_ts) * 0.5,
+                (end_ts - start_ts) / 3600.0,
+            )
+            object.__setattr__(self, "_window_cache", cached)
+        return cached
+
+    def time_window_hours(self) -> float:
+        return self._window()[3]
+
+    @property
+    def window_center_ts(self) -> float:
+        """Window midpoint as epoch seconds."""
+        return self._window()[2]
+
+    def is_within_window(self, event_time: datetime) -> bool:
+        return self.predicted_event_start <= event_time <= self.predicted_event_end
+
+    def mark_validated(self, event_id: str, notes: str = "") -> None:
+        self.validated = True
+        self.matched_event_id = event_id
+        self.validation_notes = notes
+
+    def match_events(self, events, max_sep_deg: float | None = None) -> list:
+        """Events inside this prediction's time window and sky-error circle.
+
+        Angular separations for the whole candidate batch are computed in
+        one call to the compiled haversine kernel rather than per event.
+        ``max_sep_deg`` defaults to the prediction's own error radius;
+        events without a sky position (or predictions without one) are
+        matched on time alone.
+        """
+        candidates = [e for e in events if self.is_within_window(e.event_time)]
+        if self.sky_location is None:
+            return candidates
+        located = [e for e in candidates if e.ra is not None and e.dec is not None]
+        unlocated = [e for e in candidates if e.ra is None or e.dec is None]
+        if not located:
+            return candidates
+        threshold = (
+            max_sep_deg if max_sep_deg is not None else self.sky_location.error_radius
+        )
+        n = len(located)
+        sep = haversine_deg(
+            np.full(n, self.sky_location.ra),
+            np.full(n, self.sky_location.dec),
+            np.fromiter((e.ra for e in located), np.float64, count=n),
+            np.fromiter((e.dec for e in located), np.float64, count=n),
+        )
+        return [e for e, s in zip(located, sep) if s <= threshold] + unlocated
+
+
+class PredictionParser:
+    """Extracts :class:`Prediction` records from archive text files."""
+
+    #: One capture group per pattern; keys double as field names.  ``date``
+    #: stays out of the combined scan because it uses ``findall``.
+    #:
+    #: None carry IGNORECASE: the engine would otherwise case-fold every
+    #: candidate character on every pass, so ``parse_content`` lowercases
+    #: the content once and all searches run against that buffer (captured
+    #: values are sliced from the original content by span, preserving
+    #: their case).
+    PATTERNS = {
+        "prediction_id": _re.compile(
+            r"(?:prediction|pin)\s*(?:id)?\s*[:#]\s*([a-z0-9][a-z0-9_\-]*)"
+        ),
+        "framework": _re.compile(r"\b(?:framework|key|method)\s*:\s*([a-z]+)"),
+        "frequency": _re.compile(r"\bfrequency\s*:?\s*~?([\d.]+)\s*hz"),
+        "amplitude": _re.compile(r"\bamplitude\s*:?\s*~?([\d.e+\-]+)"),
+        "duration": _re.compile(r"\bduration\s*:?\s*~?([\d.]+)\s*(?:s|sec|seconds)"),
+        "chirp_mass": _re.compile(r"\bchirp\s*mass\s*:?\s*~?([\d.]+)"),
+        "confidence": _re.compile(r"\bconfidence\s*:?\s*~?([\d.]+)\s*%?"),
+        "ra": _re.compile(r"\b(?:ra|right\s+ascension)\s*:?\s*~?([\d.]+)"),
+        "dec": _re.compile(r"\b(?:dec|declination)\s*:?\s*~?(-?[\d.]+)"),
+        "error_radius": _re.compile(r"\b(?:error\s*radius|uncertainty)\s*:?\s*~?([\d.]+)"),
+        "window": _re.compile(r"\bwindow\s*:?\s*~?([\d.]+)\s*(?:h|hr|hrs|hours)"),
+        "tags": _re.compile(r"\btags?\s*:\s*([^\n]+)"),
+        "date": _re.compile(
+            r"\b(\d{4}-\d{2}-\d{2}|\d{1,2}/\d{1,2}/\d{2,4}|\d{1,2}-\d{1,2}-\d{4})\b"
+        ),
+    }
+
+    #: Single alternation over every labelled pattern, scanned once per file
+    #: instead of one full pass per field.
+    _COMBINED = _re.compile(
+        "|".join(
+            f"(?P<{name}>{pattern.pattern})"
+            for name, pattern in PATTERNS.items()
+            if name != "date"
+        )
+    )
+
+    #: Captures ISO dates in groups 1-3 and m/d/y (or d-m-y) in groups 4-6;
+    #: one match replaces the old strptime format fan-out, which paid the
+    #: full format-string interpreter several times per unparsed date.
+    _DATE_RE = _re.compile(
+        r"(?:(\d{4})-(\d{2})-(\d{2})|(\d{1,2})[/\-](\d{1,2})[/\-](\d{2,4}))$"
+    )
+
+    #: Checked in order; rarest/most-specific types come first so mixed
+    #: documents ("tsunami following the quake") classify by the stronger
+    #: signal, and the dominant gravitational-wave type (also the default)
+    #: is last.
+    _TYPE_KEYWORDS = {
+        PredictionType.TSUNAMI: ("tsunami",),
+        PredictionType.GAMMA_RAY_BURST: ("gamma ray", "gamma-ray", "grb"),
+        PredictionType.VOLCANO: ("volcano", "volcanic", "eruption"),
+        PredictionType.BLACK_HOLE_MERGER: ("black hole", "bh merger", "merger"),
+        PredictionType.EARTHQUAKE: ("earthquake", "quake", "seismic", "tectonic"),
+        PredictionType.SOLAR_FLARE: ("solar flare", "solar", "cme", "coronal"),
+        PredictionType.GRAVITATIONAL_WAVE: (
+            "gravitational wave",
+            "gravitational-wave",
+            "ligo",
+            "gracedb",
+            "strain",
+        ),
+    }
+
+    #: Priority rank per type, in _TYPE_KEYWORDS order.  The automaton
+    #: reports hits in positional order, so mixed documents take the
+    #: minimum rank over all hits to honor the same specific-first
+    #: priority as the fallback scan.
+    _TYPE_RANK = {ptype: rank for rank, ptype in enumerate(_TYPE_KEYWORDS)}
+
+    #: Characters common to *every* keyword of a type: if one is absent
+    #: from the document, no keyword of that type can match, so the whole
+    #: type is skipped without a single substring scan.
+    _TYPE_REQUIRED_CHARS = {
+        ptype: frozenset.intersection(*(frozenset(kw) for kw in keywords))
+        for ptype, keywords in _TYPE_KEYWORDS.items()
+    }
+
+    DEFAULT_WINDOW_HOURS = 72.0
+
+    #: Aho-Corasick automaton over _TYPE_KEYWORDS, built on first use when
+    #: pyahocorasick is available.  One DFA walk over the content replaces
+    #: a separate substring scan per keyword.
+    _AC = None
+
+    @classmethod
+    def _type_automaton(cls):
+        if cls._AC is None and ahocorasick is not None:
+            automaton = ahocorasick.Automaton()
+            for ptype, keywords in cls._TYPE_KEYWORDS.items():
+                for keyword in keywords:
+                    automaton.add_word(keyword, (ptype, keyword))
+            automaton.make_automaton()
+            cls._AC = automaton
+        return cls._AC
+
+    def parse_file(self, path: Path | str) -> Prediction:
+        path = Path(path)
+        content = path.read_text(encoding="utf-8", errors="replace")
+        return self.parse_content(content, source_file=str(path))
+
+    def parse_content(self, content: str, source_file: str | None = None) -> Prediction:
+        content_lower = content.lower()
+        fields = self._scan(content, content_lower)
+
+        dates = self.PATTERNS["date"].findall(content)
+        if not dates:
+            raise PredictionParseError(
+                f"no prediction date found in {source_file or 'content'}"
+            )
+        start = self._parse_date(dates[0])
+        if start is None:
+            raise PredictionParseError(f"unparseable date {dates[0]!r}")
+
+        window_hours = self._to_float(fields.get("window")) or self.DEFAULT_WINDOW_HOURS
+        sky_location = None
+        ra = self._to_float(fields.get("ra"))
+        dec = self._to_float(fields.get("dec"))
+        if ra is not None and dec is not None:
+            sky_location = SkyLocation(
+                ra=ra,
+                dec=dec,
+                error_radius=self._to_float(fields.get("error_radius")) or 10.0,
+            )
+
+        wave_parameters = None
+        frequency = self._to_float(fields.get("frequency"))
+        amplitude = self._to_float(fields.get("amplitude"))
+        if frequency is not None or amplitude is not None:
+            wave_parameters = WaveParameters(
+                frequency_hz=frequency,
+                amplitude=amplitude,
+                duration_seconds=self._to_float(fields.get("duration")),
+                chirp_mass=self._to_float(fields.get("chirp_mass")),
+            )
+
+        return Prediction(
+            prediction_id=fields.get("prediction_id")
+            or (Path(source_file).stem if source_file else "unnamed"),
+            prediction_type=self._infer_prediction_type(content_lower),
+            framework=self._parse_framework(fields.get("framework")),
+            predicted_event_start=start,
+            predicted_event_end=start + timedelta(hours=window_hours),
+            sky_location=sky_location,
+            wave_parameters=wave_parameters,
+            confidence=self._to_float(fields.get("confidence")),
+            tags=self._extract_tags(fields.get("tags")),
+            source_file=source_file,
+        )
+
+    def _scan(self, content: str, content_lower: str) -> dict[str, str]:
+        """One pass of the combined pattern; first match wins per field.
+
+        Matching runs over the pre-lowered buffer, but captured values are
+        sliced out of the original content by span so ids and tags keep the
+        case they were written with.
+        """
+        found: dict[str, str] = {}
+        for match in self._COMBINED.finditer(content_lower):
+            name = match.lastgroup
+            if name is None or name in found:
+                continue
+            offset = match.start()
+            value = self.PATTERNS[name].search(match.group(0))
+            if value is not None:
+                found[name] = content[offset + value.start(1) : offset + value.end(1)]
+        return found
+
+    def _infer_prediction_type(self, content_lower: str) -> PredictionType:
+        automaton = self._type_automaton()
+        if automaton is not None:
+            best = None
+            best_rank = len(self._TYPE_RANK)
+            for _, (ptype, _) in automaton.iter(content_lower):
+                rank = self._TYPE_RANK[ptype]
+                if rank < best_rank:
+                    best, best_rank = ptype, rank
+                    if rank == 0:
+                        break
+            if best is not None:
+                return best
+        else:
+            present = frozenset(content_lower)
+            for ptype, keywords in self._TYPE_KEYWORDS.items():
+                if not self._TYPE_REQUIRED_CHARS[ptype] <= present:
+                    continue
+                if any(keyword in content_lower for keyword in keywords):
+                    return ptype
+        return PredictionType.GRAVITATIONAL_WAVE
+
+    def _parse_framework(self, raw: str | None) -> PredictionFramework:
+        if raw:
+            try:
+                return PredictionFramework(raw.lower())
+            except ValueError:
+                pass
+        return PredictionFramework.EXPERIMENTAL
+
+    def _parse_date(self, raw: str) -> datetime | None:
+        match = self._DATE_RE.match(raw)
+        if match is None:
+            return None
+        if match.group(1) is not None:
+            year, month, day = (int(g) for g in match.group(1, 2, 3))
+        else:
+            month, day, year = (int(g) for g in match.group(4, 5, 6))
+            if year < 100:
+                year += 2000 if year < 70 else 1900
+            if month > 12 >= day:
+                # day-first notation, e.g. 14-03-2026
+                month, day = day, month
+        try:
+            return datetime(year, month, day)
+        except ValueError:
+            return None
+
+    #: Upper bound on tags kept per prediction; dedup stops early once hit.
+    MAX_TAGS = 10
+
+    def _extract_tags(self, raw: str | None) -> list[str]:
+        if not raw:
+            return []
+        # Single ordered-dedup pass (dicts preserve insertion order), rather
+        # than building a list, a set and a second list; also keeps the
+        # author's tag order, which the set round-trip scrambled.
+        seen: dict[str, None] = {}
+        for part in raw.split(","):
+            tag = part.strip().lower()
+            if tag and tag not in seen:
+                seen[tag] = None
+                if len(seen) == self.MAX_TAGS:
+                    break
+        return list(seen)
+
+    @staticmethod
+    def _to_float(raw: str | None) -> float | None:
+        if raw is None:
+            return None
+        try:
+            return float(raw)
+        except ValueError:
+            return None
+
+class PredictionArrays(NamedTuple):
+    """Struct-of-arrays view of a prediction batch (see below)."""
+
+    start_ts: np.ndarray  # window start, epoch seconds
+    end_ts: np.ndarray  # window end, epoch seconds
+    ra: np.ndarray  # degrees; NaN when no sky location
+    dec: np.ndarray  # degrees; NaN when no sky location
+
+
+def predictions_to_arrays(predictions: list[Prediction]) -> PredictionArrays:
+    """Flatten a batch of predictions into float64 column arrays.
+
+    Batch validation over the whole archive is O(P*E) window and sky
+    comparisons; done object-by-object that is pure interpreter overhead.
+    The columnar form lets :func:`match_windows` and the sky-separation
+    math run as single vectorized NumPy passes.
+    """
+    n = len(predictions)
+    start_ts = np.fromiter(
+        (p.predicted_event_start.timestamp() for p in predictions),
+        dtype=np.float64,
+        count=n,
+    )
+    end_ts = np.fromiter(
+        (p.predicted_event_end.timestamp() for p in predictions),
+        dtype=np.float64,
+        count=n,
+    )
+    ra = np.fromiter(
+        (p.sky_location.ra if p.sky_location else np.nan for p in predictions),
+        dtype=np.float64,
+        count=n,
+    )
+    dec = np.fromiter(
+        (p.sky_location.dec if p.sky_location else np.nan for p in predictions),
+        dtype=np.float64,
+        count=n,
+    )
+    return PredictionArrays(start_ts, end_ts, ra, dec)
+
+
+def events_to_arrays(events) -> np.ndarray:
+    """Event times as epoch seconds, for broadcasting against windows."""
+    return np.fromiter(
+        (e.event_time.timestamp() for e in events), dtype=np.float64, count=len(events)
+    )
+
+
+def match_windows(pred_arrays: PredictionArrays, event_ts: np.ndarray) -> np.ndarray:
+    """Boolean (P, E) matrix: did event j land inside prediction i's window?"""
+    return (event_ts[None, :] >= pred_arrays.start_ts[:, None]) & (
+        event_ts[None, :] <= pred_arrays.end_ts[:, None]
+    )
+
+
+class PredictionTable:
+    """Columnar (struct-of-arrays) store for a prediction batch.
+
+    A validation sweep over :class:`Prediction` objects chases a pointer
+    per attribute per record; the table keeps each field in its own
+    contiguous array so batch checks stream through cache-friendly
+    columns and feed the vectorized/compiled kernels directly.  Missing
+    sky locations and frequencies are tracked in the boolean ``has_loc``
+    / ``has_freq`` columns (the value columns hold zeros there — the
+    kernels avoid NaN, see ``_scoring_numba``).
+
+    Build with :meth:`from_list` for a known batch; :meth:`append` grows
+    geometrically, so incremental loading stays amortized O(1) per row.
+    """
+
+    __slots__ = (
+        "_ids",
+        "_start_ts",
+        "_end_ts",
+        "_ra",
+        "_dec",
+        "_radius",
+        "_freq",
+        "_conf",
+        "_has_loc",
+        "_has_freq",
+        "_n",
+    )
+
+    _COLUMNS = (
+        ("_start_ts", np.float64),
+        ("_end_ts", np.float64),
+        ("_ra", np.float64),
+        ("_dec", np.float64),
+        ("_radius", np.float64),
+        ("_freq", np.float64),
+        ("_conf", np.float32),
+        ("_has_loc", np.bool_),
+        ("_has_freq", np.bool_),
+    )
+
+    def __init__(self, capacity: int = 0):
+        self._ids: list[str] = []
+        self._n = 0
+        for name, dtype in self._COLUMNS:
+            setattr(self, name, np.empty(capacity, dtype))
+
+    def __len__(self) -> int:
+        return self._n
+
+    # Columns as trimmed views; no copy, writable by the owner only.
+    @property
+    def ids(self) -> list[str]:
+        return self._ids
+
+    @property
+    def start_ts(self) -> np.ndarray:
+        return self._start_ts[: self._n]
+
+    @property
+    def end_ts(self) -> np.ndarray:
+        return self._end_ts[: self._n]
+
+    @property
+    def ra(self) -> np.ndarray:
+        return self._ra[: self._n]
+
+    @property
+    def dec(self) -> np.ndarray:
+        return self._dec[: self._n]
+
+    @property
+    def radius(self) -> np.ndarray:
+        return self._radius[: self._n]
+
+    @property
+    def freq(self) -> np.ndarray:
+        return self._freq[: self._n]
+
+    @property
+    def conf(self) -> np.ndarray:
+        return self._conf[: self._n]
+
+    @property
+    def has_loc(self) -> np.ndarray:
+        return self._has_loc[: self._n]
+
+    @property
+    def has_freq(self) -> np.ndarray:
+        return self._has_freq[: self._n]
+
+    def append(self, prediction: Prediction) -> None:
+        """Add one row, doubling column capacity when full."""
+        n = self._n
+        if n == self._start_ts.shape[0]:
+            new_cap = max(8, 2 * n)
+            for name, _ in self._COLUMNS:
+                old = getattr(self, name)
+                grown = np.empty(new_cap, old.dtype)
+                grown[:n] = old[:n]
+                setattr(self, name, grown)
+        sky = prediction.sky_location
+        wave = prediction.wave_parameters
+        freq = wave.frequency_hz if wave is not None else None
+        self._ids.append(prediction.prediction_id)
+        self._start_ts[n] = prediction.predicted_event_start.timestamp()
+        self._end_ts[n] = prediction.predicted_event_end.timestamp()
+        self._ra[n] = sky.ra if sky else 0.0
+        self._dec[n] = sky.dec if sky else 0.0
+        self._radius[n] = sky.error_radius if sky else 0.0
+        self._freq[n] = freq if freq is not None else 0.0
+        conf = prediction.confidence
+        self._conf[n] = conf if conf is not None else np.nan
+        self._has_loc[n] = sky is not None
+        self._has_freq[n] = freq is not None
+        self._n = n + 1
+
+    @classmethod
+    def from_list(cls, predictions: list[Prediction]) -> "PredictionTable":
+        """Bulk-build a table: one ``np.fromiter`` gather per column."""
+        n = len(predictions)
+        table = cls()
+        table._ids = [p.prediction_id for p in predictions]
+        table._n = n
+        table._start_ts = np.fromiter(
+            (p.predicted_event_start.timestamp() for p in predictions),
+            np.float64,
+            count=n,
+        )
+        table._end_ts = np.fromiter(
+            (p.predicted_event_end.timestamp() for p in predictions),
+            np.float64,
+            count=n,
+        )
+        table._ra = np.fromiter(
+            (p.sky_location.ra if p.sky_location else 0.0 for p in predictions),
+            np.float64,
+            count=n,
+        )
+        table._dec = np.fromiter(
+            (p.sky_location.dec if p.sky_location else 0.0 for p in predictions),
+            np.float64,
+            count=n,
+        )
+        table._radius = np.fromiter(
+            (
+                p.sky_location.error_radius if p.sky_location else 0.0
+                for p in predictions
+            ),
+            np.float64,
+            count=n,
+        )
+        table._freq = np.fromiter(
+            (
+                p.wave_parameters.frequency_hz
+                if p.wave_parameters and p.wave_parameters.frequency_hz is not None
+                else 0.0
+                for p in predictions
+            ),
+            np.float64,
+            count=n,
+        )
+        table._conf = np.fromiter(
+            (p.confidence if p.confidence is not None else np.nan for p in predictions),
+            np.float32,
+            count=n,
+        )
+        table._has_loc = np.fromiter(
+            (p.sky_location is not None for p in predictions), np.bool_, count=n
+        )
+        table._has_freq = np.fromiter(
+            (
+                p.wave_parameters is not None
+                and p.wave_parameters.frequency_hz is not None
+                for p in predictions
+            ),
+            np.bool_,
+            count=n,
+        )
+        return table
@@ -0,0 +1,537 @@
+"""Integrity hashing and event validation for archived predictions.
+
+Two concerns live here.  :class:`HashVerifier` produces canonical content
+hashes so a prediction committed to the archive can be proven unmodified
+when an event later matches it.  :class:`PredictionValidator` scores a
+prediction against an observed :class:`GravitationalWaveEvent` on time
+window, sky location and signal frequency.
+"""
+
+import hashlib
+import logging
+import math
+import os
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from functools import lru_cache
+
+import numpy as np
+
+try:
+    import numba
+except ImportError:  # pragma: no cover - optional speedup
+    numba = None
+
+try:
+    import blake3
+except ImportError:  # pragma: no cover - optional speedup
+    blake3 = None
+
+from ._kernels import haversine_deg
+from ._scoring_numba import score_all
+from .ligo_client import GravitationalWaveEvent
+from .prediction import Prediction, PredictionTable
+
+logger = logging.getLogger(__name__)
+
+#: Integrity-hash algorithm.  Prediction hashes are bookkeeping, not an
+#: external compliance format, so BLAKE2b (stdlib, SIMD-accelerated,
+#: roughly 2x SHA-256 without hardware SHA) with a 32-byte digest keeps
+#: hex lengths unchanged.  Verification still accepts legacy SHA-256
+#: digests recorded before the switch.
+HASH_ALGO = "blake2b"
+_DIGEST_SIZE = 32
+
+
+def _new_hash(data: bytes = b""):
+    return hashlib.blake2b(data, digest_size=_DIGEST_SIZE, usedforsecurity=False)
+
+
+@lru_cache(maxsize=4096)
+def _sky_canonical(sky) -> str:
+    """Canonical fragment for a SkyLocation, shared across equal values.
+
+    The value objects are frozen (hashable), so archives full of
+    predictions reusing the same handful of locations format each
+    distinct one once and share the string afterwards.
+    """
+    return f"[{sky.ra!r},{sky.dec!r},{sky.error_radius!r}]"
+
+
+@lru_cache(maxsize=4096)
+def _wave_canonical(wave) -> str:
+    """Canonical fragment for WaveParameters; see ``_sky_canonical``."""
+    return (
+        f"[{wave.frequency_hz!r},{wave.amplitude!r},"
+        f"{wave.duration_seconds!r},{wave.chirp_mass!r}]"
+    )
+
+
+def _check_sha_acceleration() -> None:
+    """One-time heads-up when hardware SHA-256 is unavailable or masked.
+
+    CPython's hashlib delegates to OpenSSL, which transparently uses the
+    SHA-NI instructions when the CPU and build allow it (a 2-5x speedup on
+    this module's hashing).  Operators can't tell from Python whether that
+    path is active, so log when the CPU lacks the flag, or when an
+    OPENSSL_ia32cap override might be masking it.  See HASHING.md.
+    """
+    try:
+        with open("/proc/cpuinfo") as f:
+            has_sha_ni = "sha_ni" in f.read()
+    except OSError:
+        return
+    if not has_sha_ni:
+        logger.info(
+            "CPU does not advertise sha_ni; SHA-256 will use OpenSSL's "
+            "generic software path"
+        )
+    elif os.environ.get("OPENSSL_ia32cap"):
+        logger.warning(
+            "OPENSSL_ia32cap is set and may disable SHA-NI despite CPU "
+            "support; unset it unless deliberately masking features"
+        )
+
+
+_check_sha_acceleration()
+
+
+class HashVerifier:
+    """Canonical hashing of predictions and archive files."""
+
+    @staticmethod
+    def compute_hash(content: str) -> str:
+        # ASCII-only strings (the canonical forms always are) take
+        # CPython's no-scan fast path through .encode("utf-8"), and their
+        # UTF-8 bytes equal their ASCII bytes, so digests stay stable even
+        # if a prediction id ever carries non-ASCII.
+        return _new_hash(content.encode("utf-8")).hexdigest()
+
+    @staticmethod
+    def compute_hash_bytes(content: bytes) -> str:
+        """Digest content that is already bytes, skipping the encode."""
+        return _new_hash(content).hexdigest()
+
+    def compute_prediction_hash(self, prediction: Prediction) -> str:
+        """Hex digest over the prediction's core fields, in canonical form.
+
+        The digest is memoized on the prediction itself and invalidated by
+        ``Prediction.__setattr__`` whenever a core field changes, so batch
+        sweeps that re-hash the same records pay the JSON/SHA cost once.
+        """
+        cached = prediction._hash_cache
+        if cached is not None:
+            return cached
+        digest = self.compute_hash(self._canonical_form(prediction))
+        prediction._hash_cache = digest
+        return digest
+
+    @staticmethod
+    def _canonical_form(prediction: Prediction) -> str:
+        """Deterministic serialization of the hash-relevant fields.
+
+        Assembled directly with f-strings in a fixed, already-sorted key
+        order: the keys are known at author time, so there is no dict to
+        build, no Timsort over keys, and no JSON encoder state machine on
+        this microsecond-scale path.  The output is stable, not meant to
+        be parsed back.
+        """
+        sky = prediction.sky_location
+        wave = prediction.wave_parameters
+        sky_s = _sky_canonical(sky) if sky else "null"
+        wave_s = _wave_canonical(wave) if wave else "null"
+        return (
+            f'{{"confidence":{prediction.confidence!r},'
+            f'"event_end":"{prediction.predicted_event_end.isoformat()}",'
+            f'"event_start":"{prediction.predicted_event_start.isoformat()}",'
+            f'"framework":"{prediction.framework.value}",'
+            f'"id":"{prediction.prediction_id}",'
+            f'"sky_location":{sky_s},'
+            f'"type":"{prediction.prediction_type.value}",'
+            f'"wave_params":{wave_s}}}'
+        )
+
+    def verify_prediction_hash(self, prediction: Prediction, expected_hash: str) -> bool:
+        """True when the prediction matches; accepts legacy SHA-256 records."""
+        if self.compute_prediction_hash(prediction) == expected_hash:
+            return True
+        legacy = hashlib.sha256(self._canonical_form(prediction).encode()).hexdigest()
+        return legacy == expected_hash
+
+    def compute_prediction_hashes(self, predictions: list[Prediction]) -> list[str]:
+        """Hash a whole batch, amortizing per-call dispatch.
+
+        hashlib already hands the actual digest to OpenSSL (which picks up
+        SHA-NI where the CPU has it); for ~250-byte canonical strings the
+        remaining cost is Python dispatch, so the batch loop binds the hot
+        callables to locals once and reuses the per-prediction memo cache.
+        Cold records are hashed by copy()ing one pre-built context, which
+        skips the per-record EVP context allocation inside hashlib.
+        """
+        canonical = self._canonical_form
+        base = _new_hash()
+        hashes: list[str] = []
+        append = hashes.append
+        for prediction in predictions:
+            digest = prediction._hash_cache
+            if digest is None:
+                ctx = base.copy()
+                ctx.update(canonical(prediction).encode())
+                digest = ctx.hexdigest()
+                prediction._hash_cache = digest
+            append(digest)
+        return hashes
+
+    def compute_manifest_hash(self, predictions: list[Prediction]) -> str:
+        """Seal a batch into one digest over its per-prediction hashes.
+
+        The leaf hashes come from the batch path (memoized, one dispatch
+        per cold record); the root is a single HASH_ALGO digest over
+        their concatenated hex forms, sorted so the manifest is
+        independent of iteration order.  Any mutation of any member
+        changes the root.
+        """
+        leaves = sorted(self.compute_prediction_hashes(predictions))
+        return _new_hash("".join(leaves).encode("ascii")).hexdigest()
+
+    @staticmethod
+    def compute_file_hash(file_path) -> str:
+        """Stream the file through OpenSSL in binary mode.
+
+        hashlib.file_digest hashes a 64KB buffer at a time with no Python-
+        level copies; the old read_text path decoded the whole file to str
+        and re-encoded it to UTF-8 just to throw both copies away.
+        """
+        with open(file_path, "rb") as handle:
+            return hashlib.file_digest(handle, _new_hash).hexdigest()
+
+    @staticmethod
+    def compute_file_hash_fast(file_path) -> str:
+        """BLAKE3 digest of a file, for large-archive sweeps.
+
+        BLAKE3's tree hash spreads one file across cores with SIMD per
+        lane, so big files hash several times faster than the BLAKE2b
+        default; update_mmap avoids staging the bytes through Python.
+        Emits 64 hex chars like the other digests but is a distinct
+        algorithm — verify_file_hash retries it after BLAKE2b and
+        SHA-256.  Falls back to compute_file_hash when blake3 is not
+        installed.
+        """
+        if blake3 is None:
+            return HashVerifier.compute_file_hash(file_path)
+        hasher = blake3.blake3(max_threads=blake3.blake3.AUTO)
+        hasher.update_mmap(os.fspath(file_path))
+        return hasher.hexdigest()
+
+    def verify_file_hash(self, file_path, expected_hash: str) -> bool:
+        """True when the file matches under any supported digest.
+
+        All three algorithms emit 64 hex chars, so the shim simply
+        retries when a digest disagrees: SHA-256 keeps records written
+        before the HASH_ALGO switch verifying, and BLAKE3 covers
+        records from compute_file_hash_fast.
+        """
+        if self.compute_file_hash(file_path) == expected_hash:
+            return True
+        with open(file_path, "rb") as handle:
+            if hashlib.file_digest(handle, "sha256").hexdigest() == expected_hash:
+                return True
+        if blake3 is None:
+            return False
+        return self.compute_file_hash_fast(file_path) == expected_hash
+
+    def create_verification_record(self, prediction: Prediction, file_path=None) -> dict:
+        """Timestamped record proving what was predicted, and when."""
+        record = {
+            "prediction_id": prediction.prediction_id,
+            "prediction_hash": self.compute_prediction_hash(prediction),
+            "recorded_at": datetime.now(timezone.utc).isoformat(),
+        }
+        if file_path is not None:
+            record["file_hash"] = self.compute_file_hash(file_path)
+            record["file_path"] = str(file_path)
+        return record
+
+
+@dataclass(slots=True)
+class ValidationResult:
+    """Outcome of scoring one prediction against one event."""
+
+    prediction_id: str
+    event_id: str
+    matched: bool
+    score: float
+    time_match: bool
+    location_match: bool
+    frequency_match: bool
+    time_diff_hours: float | None = None
+    separation_deg: float | None = None
+
+
+class PredictionValidator:
+    """Scores predictions against observed events.
+
+    Tolerances widen the predicted windows: a time tolerance in hours on
+    either side of the predicted window, degrees added to the sky error
+    radius, and Hz around the predicted frequency.
+    """
+
+    #: Score weights; a check that cannot run (missing data on either
+    #: side) passes but contributes its weight at half strength.
+    TIME_WEIGHT = 0.5
+    LOCATION_WEIGHT = 0.3
+    FREQUENCY_WEIGHT = 0.2
+
+    def __init__(
+        self,
+        time_tolerance_hours: float = 24.0,
+        location_tolerance_deg: float = 10.0,
+        frequency_tolerance_hz: float = 50.0,
+    ):
+        self.time_tolerance_hours = time_tolerance_hours
+        self.location_tolerance_deg = location_tolerance_deg
+        self.frequency_tolerance_hz = frequency_tolerance_hz
+        # Derived once: every time check otherwise repeats the hours-to-
+        # seconds conversion, which is pure overhead in the M*N loops.
+        self._time_tolerance_s = time_tolerance_hours * 3600.0
+
+    # -- individual checks -------------------------------------------------
+
+    def check_time_match(
+        self, prediction: Prediction, event_time: datetime
+    ) -> tuple[bool, float]:
+        """(hit, offset) where offset is hours from the window center.
+
+        Runs on the prediction's cached epoch-second window rather than
+        datetime/timedelta arithmetic, which allocates a timedelta per
+        comparison.
+        """
+        start_ts, end_ts, center_ts, _ = prediction._window()
+        ts = event_time.timestamp()
+        tolerance_s = self._time_tolerance_s
+        offset_hours = (ts - center_ts) / 3600.0
+        return start_ts - tolerance_s <= ts <= end_ts + tolerance_s, offset_hours
+
+    def check_location_match(
+        self, prediction: Prediction, event: GravitationalWaveEvent
+    ) -> tuple[bool, float | None]:
+        """(hit, separation_deg); a missing position on either side passes."""
+        sky = prediction.sky_location
+        if sky is None or event.ra is None or event.dec is None:
+            return True, None
+        separation = self._angular_separation(sky.ra, sky.dec, event.ra, event.dec)
+        return separation <= sky.error_radius + self.location_tolerance_deg, separation
+
+    def check_frequency_match(
+        self, prediction: Prediction, event: GravitationalWaveEvent
+    ) -> bool:
+        """Frequency agreement; missing data on either side passes."""
+        wave = prediction.wave_parameters
+        if wave is None or wave.frequency_hz is None or event.frequency is None:
+            return True
+        return abs(wave.frequency_hz - event.frequency) <= self.frequency_tolerance_hz
+
+    @staticmethod
+    def _as_table(
+        predictions: "list[Prediction] | PredictionTable",
+    ) -> PredictionTable:
+        if isinstance(predictions, PredictionTable):
+            return predictions
+        return PredictionTable.from_list(predictions)
+
+    def check_time_match_batch(
+        self,
+        predictions: "list[Prediction] | PredictionTable",
+        event_time: datetime,
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """(mask, offsets) for a batch; offsets are hours from window center.
+
+        Pure epoch-second arithmetic over the table's timestamp columns —
+        no per-prediction datetime or timedelta objects.
+        """
+        table = self._as_table(predictions)
+        ts = event_time.timestamp()
+        tolerance_s = self._time_tolerance_s
+        start = table.start_ts
+        end = table.end_ts
+        mask = (start - tolerance_s <= ts) & (ts <= end + tolerance_s)
+        offsets = (ts - (start + end) * 0.5) / 3600.0
+        return mask, offsets
+
+    def check_location_match_batch(
+        self,
+        predictions: "list[Prediction] | PredictionTable",
+        event_ra: float,
+        event_dec: float,
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """(mask, separations) for a prediction batch against one position.
+
+        The compiled haversine kernel scores every pair in a single call
+        instead of one Python trig sequence per prediction.  Predictions
+        without a sky location match (mirroring the scalar check's
+        "missing data passes" rule) and get NaN separations.
+        """
+        table = self._as_table(predictions)
+        n = len(table)
+        separations = haversine_deg(
+            table.ra, table.dec, np.full(n, event_ra), np.full(n, event_dec)
+        )
+        has_loc = table.has_loc
+        mask = ~has_loc | (separations <= table.radius + self.location_tolerance_deg)
+        return mask, np.where(has_loc, separations, np.nan)
+
+    def check_frequency_match_batch(
+        self,
+        predictions: "list[Prediction] | PredictionTable",
+        event_freq: float | None,
+    ) -> np.ndarray:
+        """Boolean mask for a batch; missing data on either side passes."""
+        table = self._as_table(predictions)
+        if event_freq is None:
+            return np.ones(len(table), np.bool_)
+        hit = np.abs(table.freq - event_freq) <= self.frequency_tolerance_hz
+        return hit | ~table.has_freq
+
+    @staticmethod
+    def _angular_separation(ra1: float, dec1: float, ra2: float, dec2: float) -> float:
+        """Great-circle separation in degrees (haversine form)."""
+        r1, d1, r2, d2 = map(math.radians, (ra1, dec1, ra2, dec2))
+        sin_ddec = math.sin((d2 - d1) / 2)
+        sin_dra = math.sin((r2 - r1) / 2)
+        a = sin_ddec**2 + math.cos(d1) * math.cos(d2) * sin_dra**2
+        return math.degrees(2 * math.asin(math.sqrt(a)))
+
+    # -- scoring -----------------------------------------------------------
+
+    def validate_against_event(
+        self,
+        prediction: Prediction,
+        event: GravitationalWaveEvent,
+        run_all_checks: bool = False,
+    ) -> ValidationResult:
+        """Score one prediction against one event.
+
+        The time check runs first: it is the cheapest and rejects most of
+        a catalog sweep (events simply outside every window), so a miss
+        skips the location trig and frequency comparison entirely and
+        reports a zero score.  Pass ``run_all_checks=True`` to force the
+        full per-check breakdown for auditing.
+        """
+        time_hit, offset_hours = self.check_time_match(prediction, event.event_time)
+        if not time_hit and not run_all_checks:
+            return ValidationResult(
+                prediction_id=prediction.prediction_id,
+                event_id=event.event_id,
+                matched=False,
+                score=0.0,
+                time_match=False,
+                location_match=False,
+                frequency_match=False,
+                time_diff_hours=offset_hours,
+                separation_deg=None,
+            )
+        location_hit, separation = self.check_location_match(prediction, event)
+        frequency_hit = self.check_frequency_match(prediction, event)
+
+        score = 0.0
+        if time_hit:
+            score += self.TIME_WEIGHT
+        if location_hit:
+            weight = self.LOCATION_WEIGHT if separation is not None else self.LOCATION_WEIGHT / 2
+            score += weight
+        if frequency_hit:
+            ran = (
+                prediction.wave_parameters is not None
+                and prediction.wave_parameters.frequency_hz is not None
+                and event.frequency is not None
+            )
+            score += self.FREQUENCY_WEIGHT if ran else self.FREQUENCY_WEIGHT / 2
+
+        return ValidationResult(
+            prediction_id=prediction.prediction_id,
+            event_id=event.event_id,
+            matched=time_hit and location_hit and frequency_hit,
+            score=score,
+            time_match=time_hit,
+            location_match=location_hit,
+            frequency_match=frequency_hit,
+            time_diff_hours=offset_hours,
+            separation_deg=separation,
+        )
+
+    def validate_against_event_batch(
+        self,
+        predictions: "list[Prediction] | PredictionTable",
+        event: GravitationalWaveEvent,
+    ) -> np.ndarray:
+        """Scores for a whole batch against one event, as a float64 array.
+
+        Accepts a :class:`PredictionTable` (or builds one from a list) and
+        hands its columns plus the missing-data masks to the compiled
+        ``score_all`` kernel, so backtesting sweeps pay one call instead
+        of N interpreted ``validate_against_event`` invocations.  Scores
+        are identical to the scalar path with ``run_all_checks=True``;
+        the kernel's fused loop gains nothing from branching out early.
+        """
+        table = self._as_table(predictions)
+        # Negative sentinels for missing event data; the kernel avoids NaN
+        # because fastmath assumes it away.
+        return score_all(
+            table.start_ts,
+            table.end_ts,
+            table.ra,
+            table.dec,
+            table.radius,
+            table.freq,
+            table.has_loc,
+            table.has_freq,
+            event.event_time.timestamp(),
+            event.ra if event.ra is not None and event.dec is not None else -1.0,
+            event.dec if event.dec is not None else 0.0,
+            event.frequency if event.frequency is not None else -1.0,
+            self._time_tolerance_s,
+            self.location_tolerance_deg,
+            self.frequency_tolerance_hz,
+        )
+
+    def validate_batch_parallel(
+        self,
+        predictions: "list[Prediction] | PredictionTable",
+        events: list[GravitationalWaveEvent],
+        workers: int | None = None,
+    ) -> np.ndarray:
+        """(E, P) score matrix for every (event, prediction) pair.
+
+        The table is built once and each event sweep runs through the
+        compiled ``score_all`` kernel, whose prange loop already spreads
+        the predictions across cores; ``workers`` caps the numba thread
+        count for the sweep.  A process pool buys nothing here — pickling
+        the prediction objects to worker processes costs more than the
+        arithmetic being distributed — so parallelism stays inside the
+        kernel, where the rows are shared and GIL-free.
+        """
+        table = self._as_table(predictions)
+        if workers is not None and numba is not None:
+            previous = numba.get_num_threads()
+            numba.set_num_threads(
+                max(1, min(workers, numba.config.NUMBA_NUM_THREADS))
+            )
+        scores = np.empty((len(events), len(table)), np.float64)
+        try:
+            for j, event in enumerate(events):
+                scores[j] = self.validate_against_event_batch(table, event)
+        finally:
+            if workers is not None and numba is not None:
+                numba.set_num_threads(previous)
+        return scores
+
+    def validate_against_events(
+        self, prediction: Prediction, events: list[GravitationalWaveEvent]
+    ) -> ValidationResult | None:
+        """Best-scoring result across ``events``, or None when empty."""
+        best: ValidationResult | None = None
+        for event in events:
+            result = self.validate_against_event(prediction, event)
+            if best is None or result.score > best.score:
+                best = result
+        return best
@@ -0,0 +1,22 @@
+"""Document-to-Markdown conversion for the prediction archive."""
+
+from .converters import (
+    Converter,
+    ImageConverter,
+    OfficeConverter,
+    PDFConverter,
+    WebConverter,
+)
+from .core import Transliterator
+from .errors import TransliterationError, UnsupportedFormatError
+
+__all__ = [
+    "Converter",
+    "ImageConverter",
+    "OfficeConverter",
+    "PDFConverter",
+    "Transliterator",
+    "TransliterationError",
+    "UnsupportedFormatError",
+    "WebConverter",
+]
@@ -0,0 +1,135 @@
+"""Command-line entry point: transliterate documents into Markdown."""
+
+import argparse
+import multiprocessing
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from pathlib import Path
+
+from .core import Transliterator
+from .errors import TransliterationError
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="transliterate",
+        description="Convert documents and images into Markdown.",
+    )
+    parser.add_argument(
+        "sources", nargs="*", help="files or directories to convert"
+    )
+    parser.add_argument(
+        "-o",
+        "--output",
+        default="output",
+        help="directory for the generated .md files (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--stdout",
+        action="store_true",
+        help="print the Markdown instead of writing files",
+    )
+    parser.add_argument(
+        "--formats",
+        action="store_true",
+        help="list the supported formats and exit",
+    )
+    return parser
+
+
+def _show_formats(transliterator: Transliterator) -> None:
+    for extension, description in transliterator.supported_formats().items():
+        print(f"{extension:8} {description}")
+
+
+def _convert_one(source: str, output_dir: str, to_stdout: bool) -> str:
+    """Convert one source and return what to print for it.
+
+    Module-level (and building its own Transliterator) so it pickles
+    cleanly into ProcessPoolExecutor workers.
+    """
+    transliterator = Transliterator()
+    if Transliterator._is_url(source):
+        # Keep the string: Path() would strip the scheme's double slash
+        # and defeat URL detection downstream.
+        if to_stdout:
+            return transliterator.convert(source)
+        return f"wrote {transliterator.convert_file(source, output_dir)}"
+    path = Path(source)
+    if path.is_dir():
+        written = transliterator.convert_directory(path, output_dir)
+        return "\n".join(f"wrote {out_path}" for out_path in written)
+    if to_stdout:
+        return transliterator.convert(path)
+    return f"wrote {transliterator.convert_file(path, output_dir)}"
+
+
+def main(argv=None) -> int:
+    parser = _build_parser()
+    args = parser.parse_args(argv)
+    if args.formats:
+        _show_formats(Transliterator())
+        return 0
+    if not args.sources:
+        parser.error("no sources given")
+    failures = 0
+    urls = [source for source in args.sources if Transliterator._is_url(source)]
+    if len(urls) > 1:
+        # URL conversion waits on the network, not the CPU, so URLs
+        # share a thread pool (requests releases the GIL in its
+        # sockets) rather than process workers; results are printed in
+        # submission order from this thread, so output never
+        # interleaves.
+        with ThreadPoolExecutor(max_workers=min(8, len(urls))) as executor:
+            futures = [
+                executor.submit(_convert_one, url, args.output, args.stdout)
+                for url in urls
+            ]
+            for url, future in zip(urls, futures):
+                try:
+                    print(future.result())
+                except (TransliterationError, OSError) as exc:
+                    print(f"error: {url}: {exc}", file=sys.stderr)
+                    failures += 1
+        sources = [
+            source
+            for source in args.sources
+            if not Transliterator._is_url(source)
+        ]
+    else:
+        # Zero or one URL rides along with the local sources.
+        sources = args.sources
+    if len(sources) > 1:
+        # Sources are independent and dominated by parsing/OCR, so fan
+        # them out across processes.  Results are collected in submission
+        # order, which keeps --stdout output deterministic while the
+        # workers still run concurrently.
+        workers = min(len(sources), os.cpu_count() or 1)
+        # spawn, not fork: the host process may already hold thread locks
+        # (OCR and JIT libraries start their own pools), and forking such
+        # a parent can deadlock the workers.
+        context = multiprocessing.get_context("spawn")
+        with ProcessPoolExecutor(max_workers=workers, mp_context=context) as executor:
+            futures = [
+                executor.submit(_convert_one, source, args.output, args.stdout)
+                for source in sources
+            ]
+            for source, future in zip(sources, futures):
+                try:
+                    print(future.result())
+                except (TransliterationError, OSError) as exc:
+                    print(f"error: {source}: {exc}", file=sys.stderr)
+                    failures += 1
+    else:
+        for source in sources:
+            try:
+                print(_convert_one(source, args.output, args.stdout))
+            except (TransliterationError, OSError) as exc:
+                print(f"error: {source}: {exc}", file=sys.stderr)
+                failures += 1
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,15 @@
+"""Format converters, one class per document family."""
+
+from .base import Converter
+from .image import ImageConverter
+from .office import OfficeConverter
+from .pdf import PDFConverter
+from .web import WebConverter
+
+__all__ = [
+    "Converter",
+    "ImageConverter",
+    "OfficeConverter",
+    "PDFConverter",
+    "WebConverter",
+]
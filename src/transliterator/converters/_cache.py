@@ -0,0 +1,86 @@
+"""Content-addressed on-disk cache for converted Markdown.
+
+Conversion is a deterministic function of the input bytes, so entries
+are keyed by SHA-256 of the content and a repeat conversion collapses
+to one file read.  Each entry is ``<dir>/<key[:2]>/<key>.md`` with a
+JSON sidecar carrying the cache version plus whatever metadata the
+caller stores (ETag, Last-Modified, source).
+"""
+
+import hashlib
+import json
+import logging
+import os
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+#: Bumped when converter output changes shape; entries written under a
+#: different version never surface.
+CACHE_VERSION = 1
+
+_CACHE_DIR = Path(
+    os.environ.get("TRANSLITERATOR_CACHE_DIR", "~/.cache/transliterator")
+).expanduser()
+
+
+def hash_file(path) -> str:
+    """SHA-256 of a file, streamed without loading it whole."""
+    with open(path, "rb") as handle:
+        return hashlib.file_digest(handle, "sha256").hexdigest()
+
+
+def hash_bytes(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+def _entry_path(key: str) -> Path:
+    return _CACHE_DIR / key[:2] / (key + ".md")
+
+
+def _meta_path(key: str) -> Path:
+    return _CACHE_DIR / key[:2] / (key + ".json")
+
+
+def get(key: str) -> "str | None":
+    """Cached Markdown for ``key``, or None on miss or version skew."""
+    meta = get_meta(key)
+    if meta is None:
+        return None
+    try:
+        return _entry_path(key).read_text(encoding="utf-8")
+    except OSError:
+        return None
+
+
+def put(key: str, markdown: str, **meta) -> None:
+    """Store Markdown under ``key`` with a versioned metadata sidecar."""
+    entry = _entry_path(key)
+    try:
+        entry.parent.mkdir(parents=True, exist_ok=True)
+        entry.write_text(markdown, encoding="utf-8")
+        put_meta(key, meta)
+    except OSError:  # cache is best-effort; conversion already succeeded
+        logger.debug("could not write cache entry %s", key, exc_info=True)
+
+
+def get_meta(key: str) -> "dict | None":
+    """Sidecar metadata for ``key``, or None on miss or version skew."""
+    try:
+        meta = json.loads(_meta_path(key).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    if meta.get("version") != CACHE_VERSION:
+        return None
+    return meta
+
+
+def put_meta(key: str, meta: dict) -> None:
+    path = _meta_path(key)
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(
+            json.dumps({**meta, "version": CACHE_VERSION}), encoding="utf-8"
+        )
+    except OSError:
+        logger.debug("could not write cache sidecar %s", key, exc_info=True)
@@ -0,0 +1,18 @@
+"""Shared converter interface."""
+
+from pathlib import Path
+
+
+class Converter:
+    """Base class for format converters.
+
+    Subclasses declare the ``extensions`` they handle (lowercase, with
+    the leading dot), a one-line ``description`` for the CLI listing,
+    and implement :meth:`convert` returning Markdown text.
+    """
+
+    extensions: tuple[str, ...] = ()
+    description: str = ""
+
+    def convert(self, file_path: Path) -> str:
+        raise NotImplementedError
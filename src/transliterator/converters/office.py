@@ -0,0 +1,279 @@
+"""Office document conversion: .docx and .xlsx to Markdown."""
+
+import logging
+import re
+import tempfile
+from datetime import date, datetime
+from pathlib import Path
+
+try:
+    from python_calamine import CalamineWorkbook
+except ImportError:  # pragma: no cover - optional speedup
+    CalamineWorkbook = None
+
+try:
+    from lxml import etree
+except ImportError:  # pragma: no cover - optional speedup
+    etree = None
+
+from ..errors import TransliterationError
+from .base import Converter
+
+logger = logging.getLogger(__name__)
+
+#: Compiled once: one match() replaces the per-paragraph
+#: startswith/replace/strip/isdigit chain for heading styles.  It
+#: matches both style names ("Heading 1") and style ids ("Heading1").
+_HEADING_RE = re.compile(r"Heading\s*(\d+)")
+
+#: Cell formatters dispatched on exact type, probed with
+#: _CELL_FMT.get(type(cell), str): sheets are dominated by a handful of
+#: concrete types, and one dict probe beats generic str()'s __str__
+#: resolution per cell.  'g' keeps integer-valued floats from rendering
+#: with a trailing .0.
+_CELL_FMT = {
+    str: lambda value: value,
+    int: str,
+    float: lambda value: format(value, "g"),
+    datetime: lambda value: value.isoformat(),
+    date: lambda value: value.isoformat(),
+}
+
+#: WordprocessingML tags, fully qualified once at import.
+_W_NS = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+_P_TAG = _W_NS + "p"
+_TBL_TAG = _W_NS + "tbl"
+_T_TAG = _W_NS + "t"
+_PSTYLE_PATH = _W_NS + "pPr/" + _W_NS + "pStyle"
+_VAL_ATTR = _W_NS + "val"
+
+
+class OfficeConverter(Converter):
+    """Convert Word documents and Excel workbooks to Markdown."""
+
+    extensions = (".docx", ".xlsx")
+    description = "Word and Excel documents"
+
+    def convert(self, file_path: Path) -> str:
+        if file_path.suffix.lower() == ".docx":
+            return self._convert_docx(file_path)
+        return self._convert_xlsx(file_path)
+
+    @staticmethod
+    def convert_bytes(data: bytes, suffix: str) -> str:
+        """Convert an in-memory ``.docx``/``.xlsx`` payload.
+
+        Both backends open documents by path (python-docx and calamine
+        have no stream entry point), so the payload is spilled to a
+        temp file for the duration of the parse and removed after.
+        """
+        with tempfile.NamedTemporaryFile(suffix=suffix, delete=False) as tmp:
+            tmp.write(data)
+        path = Path(tmp.name)
+        try:
+            return OfficeConverter().convert(path)
+        finally:
+            path.unlink(missing_ok=True)
+
+    def _convert_docx(self, file_path: Path) -> str:
+        """Walk the document body in order, emitting paragraphs and tables.
+
+        The lxml path reads word/document.xml straight out of the zip
+        container and touches only text and style per paragraph, skipping
+        the Paragraph/Run/Font wrappers python-docx builds for every
+        <w:p>; python-docx is instantiated lazily only when a table needs
+        rendering, and carries the whole document as the fallback.
+        """
+        if etree is not None:
+            return self._convert_docx_lxml(file_path)
+        return self._convert_docx_python_docx(file_path)
+
+    def _convert_docx_lxml(self, file_path: Path) -> str:
+        import zipfile
+
+        with zipfile.ZipFile(file_path) as archive:
+            with archive.open("word/document.xml") as handle:
+                tree = etree.parse(handle)
+        body = tree.getroot().find(_W_NS + "body")
+        lines: list[str] = []
+        tables = None
+        table_index = 0
+        for element in body if body is not None else ():
+            tag = element.tag
+            if tag == _P_TAG:
+                text = "".join(t.text or "" for t in element.iter(_T_TAG)).strip()
+                if not text:
+                    continue
+                style = element.find(_PSTYLE_PATH)
+                style_name = "" if style is None else style.get(_VAL_ATTR, "")
+                self._append_paragraph(lines, style_name, text)
+            elif tag == _TBL_TAG:
+                if tables is None:
+                    try:
+                        from docx import Document
+                    except ImportError as exc:
+                        raise TransliterationError(
+                            "python-docx is required for .docx tables"
+                        ) from exc
+                    tables = Document(str(file_path)).tables
+                if table_index < len(tables):
+                    lines.extend((self._table_to_markdown(tables[table_index]), ""))
+                table_index += 1
+        return "\n".join(lines).strip() + "\n"
+
+    def _convert_docx_python_docx(self, file_path: Path) -> str:
+        try:
+            from docx import Document
+        except ImportError as exc:
+            raise TransliterationError(
+                "lxml or python-docx is required for .docx input"
+            ) from exc
+        doc = Document(str(file_path))
+        # One hash probe per body element instead of rescanning
+        # doc.paragraphs/doc.tables, which is quadratic in document length.
+        paragraph_by_element = {id(p._element): p for p in doc.paragraphs}
+        table_by_element = {id(t._element): t for t in doc.tables}
+        # Documents reuse a handful of styles across thousands of
+        # paragraphs; resolving .name walks the style inheritance chain,
+        # so cache it per style object.
+        style_names: dict[int, str] = {}
+        lines: list[str] = []
+        for element in doc.element.body:
+            tag = element.tag.rsplit("}", 1)[-1]
+            if tag == "p":
+                paragraph = paragraph_by_element.get(id(element))
+                if paragraph is None:
+                    continue
+                text = paragraph.text.strip()
+                if not text:
+                    continue
+                style = paragraph.style
+                if style is None:
+                    style_name = ""
+                else:
+                    style_name = style_names.get(id(style))
+                    if style_name is None:
+                        style_name = style.name or ""
+                        style_names[id(style)] = style_name
+                self._append_paragraph(lines, style_name, text)
+            elif tag == "tbl":
+                table = table_by_element.get(id(element))
+                if table is not None:
+                    lines.extend((self._table_to_markdown(table), ""))
+        return "\n".join(lines).strip() + "\n"
+
+    @staticmethod
+    def _append_paragraph(lines: list[str], style_name: str, text: str) -> None:
+        """Classify one paragraph by style and append its Markdown."""
+        heading = _HEADING_RE.match(style_name)
+        if heading is not None:
+            level = min(int(heading.group(1)), 6)
+            lines.extend(("#" * level + " " + text, ""))
+        elif style_name == "Title":
+            lines.extend(("# " + text, ""))
+        elif style_name.startswith("List"):
+            lines.append("- " + text)
+        else:
+            lines.extend((text, ""))
+
+    @staticmethod
+    def _table_to_markdown(table) -> str:
+        rows = [
+            [cell.text.strip().replace("\n", " ") for cell in row.cells]
+            for row in table.rows
+        ]
+        if not rows:
+            return ""
+        # Pad ragged rows (merged cells) to the widest row so the table
+        # stays well-formed; embedded newlines are flattened above for
+        # the same reason.
+        cols = max(map(len, rows))
+        parts = [
+            "| " + " | ".join(row + [""] * (cols - len(row))) + " |\n"
+            for row in rows
+        ]
+        parts.insert(1, "| " + " | ".join(["---"] * cols) + " |\n")
+        return "".join(parts)
+
+    def _convert_xlsx(self, file_path: Path) -> str:
+        """One Markdown table per non-empty sheet, first row as header.
+
+        python-calamine decodes rows in native code and hands back plain
+        Python values, so the fast path streams sheet-by-sheet without
+        openpyxl's per-cell object allocation; openpyxl remains as the
+        fallback when calamine is not installed.
+        """
+        if CalamineWorkbook is not None:
+            return self._convert_xlsx_calamine(file_path)
+        return self._convert_xlsx_openpyxl(file_path)
+
+    @staticmethod
+    def _convert_xlsx_calamine(file_path: Path) -> str:
+        workbook = CalamineWorkbook.from_path(str(file_path))
+        sections: list[str] = []
+        for sheet_name in workbook.sheet_names:
+            sheet = workbook.get_sheet_by_name(sheet_name)
+            rows = sheet.to_python(skip_empty_area=True)
+            if not rows:
+                continue
+            header = [
+                "" if cell is None else _CELL_FMT.get(type(cell), str)(cell)
+                for cell in rows[0]
+            ]
+            parts = [
+                f"## {sheet_name}\n\n",
+                "| " + " | ".join(header) + " |\n",
+                "| " + " | ".join(["---"] * len(header)) + " |\n",
+            ]
+            for row in rows[1:]:
+                cells = (
+                    "" if cell is None else _CELL_FMT.get(type(cell), str)(cell)
+                    for cell in row
+                )
+                parts.append("| " + " | ".join(cells) + " |\n")
+            sections.append("".join(parts))
+        return "\n".join(sections)
+
+    @staticmethod
+    def _convert_xlsx_openpyxl(file_path: Path) -> str:
+        try:
+            import openpyxl
+        except ImportError as exc:
+            raise TransliterationError(
+                "python-calamine or openpyxl is required for .xlsx input"
+            ) from exc
+        workbook = openpyxl.load_workbook(
+            str(file_path), read_only=True, data_only=True
+        )
+        try:
+            sections: list[str] = []
+            for worksheet in workbook.worksheets:
+                # Stream rows straight off the read-only worksheet; a
+                # wide sheet never exists in memory as a list of lists.
+                parts: list[str] = []
+                for row in worksheet.iter_rows(values_only=True):
+                    if not parts:
+                        header = [
+                            ""
+                            if cell is None
+                            else _CELL_FMT.get(type(cell), str)(cell)
+                            for cell in row
+                        ]
+                        parts = [
+                            f"## {worksheet.title}\n\n",
+                            "| " + " | ".join(header) + " |\n",
+                            "| " + " | ".join(["---"] * len(header)) + " |\n",
+                        ]
+                        continue
+                    cells = (
+                        ""
+                        if cell is None
+                        else _CELL_FMT.get(type(cell), str)(cell)
+                        for cell in row
+                    )
+                    parts.append("| " + " | ".join(cells) + " |\n")
+                if parts:
+                    sections.append("".join(parts))
+            return "\n".join(sections)
+        finally:
+            workbook.close()
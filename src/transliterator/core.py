@@ -0,0 +1,242 @@
+"""Front door for document-to-Markdown conversion.
+
+:class:`Transliterator` keeps a registry mapping file extensions to the
+converter handling them and exposes convert/convert_file/
+convert_directory on top of it.  Converter dependencies are probed
+once at converter-module import and missing ones surface as
+TransliterationError only from the conversions that need them, so
+constructing a Transliterator never requires the optional document
+libraries.
+"""
+
+import logging
+import multiprocessing
+import os
+import queue
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from .converters import (
+    ImageConverter,
+    OfficeConverter,
+    PDFConverter,
+    WebConverter,
+)
+from .errors import TransliterationError, UnsupportedFormatError
+
+logger = logging.getLogger(__name__)
+
+_CONVERTER_CLASSES = (OfficeConverter, ImageConverter, PDFConverter)
+
+
+class Transliterator:
+    """Dispatch files to the converter registered for their extension."""
+
+    #: Single-slot memo for supported_formats: the registry is built from
+    #: the module-level converter list, so the mapping is identical for
+    #: every instance and for the life of the process.
+    _supported_formats: dict[str, str] | None = None
+
+    def __init__(self):
+        self._converters = {}
+        for converter_class in _CONVERTER_CLASSES:
+            converter = converter_class()
+            for extension in converter.extensions:
+                self._converters[extension] = converter
+        self._web_converter = WebConverter()
+
+    @staticmethod
+    def _is_url(source) -> bool:
+        return isinstance(source, str) and source.startswith(
+            ("http://", "https://")
+        )
+
+    def supported_formats(self) -> dict[str, str]:
+        """Mapping of extension to a one-line converter description."""
+        formats = Transliterator._supported_formats
+        if formats is None:
+            formats = {
+                extension: converter.description
+                for extension, converter in sorted(self._converters.items())
+            }
+            Transliterator._supported_formats = formats
+        return formats
+
+    def convert(self, source) -> str:
+        """Convert one file or URL, returning its Markdown text."""
+        if self._is_url(source):
+            return self._web_converter.convert_url(source)
+        path = Path(source)
+        if not path.is_file():
+            raise FileNotFoundError(path)
+        converter = self._converters.get(path.suffix.lower())
+        if converter is None:
+            raise UnsupportedFormatError(f"unsupported format: {path.suffix!r}")
+        logger.debug("converting %s with %s", path, type(converter).__name__)
+        return converter.convert(path)
+
+    def convert_urls(self, urls: "list[str]") -> "list[str]":
+        """Markdown for a batch of URLs, fetched concurrently."""
+        return self._web_converter.convert_urls(urls)
+
+    def convert_file(
+        self, source, output_dir, incremental: bool = True
+    ) -> Path:
+        """Convert one file and write ``<stem>.md`` under ``output_dir``.
+
+        With ``incremental`` (the default), a source no newer than its
+        existing output is skipped outright — one stat pair instead of
+        a full re-parse on no-op rebuilds.  URLs always convert; their
+        conditional-fetch cache plays the same role upstream.
+        """
+        out_dir = Path(output_dir)
+        out_dir.mkdir(parents=True, exist_ok=True)
+        is_url = self._is_url(source)
+        if is_url:
+            stem = self._web_converter._url_to_filename(source)
+        else:
+            stem = Path(source).stem
+        out_path = out_dir / (stem + ".md")
+        if (
+            incremental
+            and not is_url
+            and _output_is_current(Path(source), out_path)
+        ):
+            logger.debug("output current for %s, skipping", source)
+            return out_path
+        markdown = self.convert(source)
+        out_path.write_text(markdown, encoding="utf-8")
+        return out_path
+
+    def convert_directory(
+        self,
+        directory,
+        output_dir,
+        workers: "int | None" = None,
+        incremental: bool = True,
+    ) -> list[Path]:
+        """Convert every supported file directly under ``directory``.
+
+        Files are independent and conversion is CPU-heavy, so batches
+        fan out across a spawn process pool sized to the core count
+        (``workers`` overrides; 1 forces the in-process path).  Failures
+        are logged and skipped so one corrupt document does not abort
+        the sweep; the returned paths keep directory order.  With
+        ``incremental`` (the default), sources no newer than their
+        existing outputs are not re-parsed.
+        """
+        # scandir serves is_file() from cached readdir data, skipping the
+        # per-entry stat round trip iterdir + is_file() pays (noticeable
+        # on network filesystems).
+        with os.scandir(directory) as it:
+            entries = sorted(
+                (
+                    entry
+                    for entry in it
+                    if entry.is_file(follow_symlinks=False)
+                ),
+                key=lambda entry: entry.name,
+            )
+        paths = [
+            Path(entry.path)
+            for entry in entries
+            if os.path.splitext(entry.name)[1].lower() in self._converters
+        ]
+        if workers is None:
+            workers = os.cpu_count() or 1
+        written: list[Path] = []
+        if min(workers, len(paths)) > 1:
+            context = multiprocessing.get_context("spawn")
+            with ProcessPoolExecutor(
+                max_workers=min(workers, len(paths)), mp_context=context
+            ) as executor:
+                futures = [
+                    executor.submit(
+                        _convert_directory_entry,
+                        str(path),
+                        str(output_dir),
+                        incremental,
+                    )
+                    for path in paths
+                ]
+                for path, future in zip(paths, futures):
+                    try:
+                        written.append(Path(future.result()))
+                    except (TransliterationError, OSError):
+                        logger.warning("failed to convert %s", path, exc_info=True)
+            return written
+        out_dir = Path(output_dir)
+        out_dir.mkdir(parents=True, exist_ok=True)
+        writer = _BackgroundWriter()
+        try:
+            for path in paths:
+                out_path = out_dir / (path.stem + ".md")
+                if incremental and _output_is_current(path, out_path):
+                    logger.debug("output current for %s, skipping", path)
+                    written.append(out_path)
+                    continue
+                try:
+                    markdown = self.convert(path)
+                except (TransliterationError, OSError):
+                    logger.warning("failed to convert %s", path, exc_info=True)
+                    continue
+                writer.put(out_path, markdown)
+                written.append(out_path)
+        finally:
+            writer.close()
+        if writer.failed:
+            failed = set(writer.failed)
+            written = [path for path in written if path not in failed]
+        return written
+
+
+class _BackgroundWriter:
+    """Single writer thread so output I/O overlaps the next parse.
+
+    In a serial directory sweep the write of one document is
+    independent of the parse of the next, so finished Markdown is
+    queued to a daemon thread instead of blocking the converting
+    thread on disk.  Failed writes are logged and collected in
+    ``failed``; ``close`` drains the queue and joins the thread.
+    """
+
+    def __init__(self):
+        self._queue: queue.Queue = queue.Queue()
+        self.failed: list[Path] = []
+        self._thread = threading.Thread(target=self._drain, daemon=True)
+        self._thread.start()
+
+    def _drain(self) -> None:
+        while True:
+            item = self._queue.get()
+            if item is None:
+                return
+            out_path, markdown = item
+            try:
+                out_path.write_text(markdown, encoding="utf-8")
+            except OSError:
+                logger.warning("failed to write %s", out_path, exc_info=True)
+                self.failed.append(out_path)
+
+    def put(self, out_path: Path, markdown: str) -> None:
+        self._queue.put((out_path, markdown))
+
+    def close(self) -> None:
+        self._queue.put(None)
+        self._thread.join()
+
+
+def _output_is_current(source: Path, out_path: Path) -> bool:
+    """True if ``out_path`` exists and is at least as new as ``source``."""
+    try:
+        return out_path.stat().st_mtime_ns >= source.stat().st_mtime_ns
+    except OSError:
+        return False
+
+
+def _convert_directory_entry(
+    source: str, output_dir: str, incremental: bool = True
+) -> str:
+    """Worker for convert_directory; module-level so it pickles."""
+    return str(Transliterator().convert_file(source, output_dir, incremental))
@@ -0,0 +1,9 @@
+"""Exception types for the transliterator package."""
+
+
+class TransliterationError(Exception):
+    """Raised when a document cannot be converted to Markdown."""
+
+
+class UnsupportedFormatError(TransliterationError):
+    """Raised when no converter is registered for a file's extension."""
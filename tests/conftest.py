@@ -0,0 +1,26 @@
+"""Make the src layout importable without an install step."""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+import numpy as np
+import pytest
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _warm_compiled_kernels():
+    """Compile (or cache-load) the numba kernels before the first test.
+
+    First use of an njit function pays the JIT cost; warming here keeps
+    that out of individual test timings and out of whichever test happens
+    to run first.
+    """
+    from prediction_engine._kernels import haversine_deg
+    from prediction_engine._scoring_numba import score_all
+
+    z = np.zeros(1)
+    f = np.zeros(1, np.bool_)
+    haversine_deg(z, z, z, z)
+    score_all(z, z, z, z, z, z, f, f, 0.0, -1.0, 0.0, -1.0, 0.0, 0.0, 0.0)
@@ -0,0 +1,308 @@
+"""Integration tests for the prediction engine.
+
+Exercises the full archive path: parsing a prediction document, hashing
+it, querying a (mocked) LIGO client and validating against events.
+"""
+
+from datetime import datetime, timedelta
+
+import numpy as np
+import pytest
+
+from prediction_engine import (
+    GravitationalWaveEvent,
+    HashVerifier,
+    LIGOClient,
+    Prediction,
+    PredictionFramework,
+    PredictionParser,
+    PredictionType,
+    PredictionValidator,
+    SkyLocation,
+)
+from prediction_engine._kernels import haversine_deg
+from prediction_engine.prediction import (
+    events_to_arrays,
+    match_windows,
+    predictions_to_arrays,
+)
+
+
+#: Frozen clock shared by every fixture: one datetime construction per
+#: module instead of a clock_gettime syscall per event, and the window
+#: assertions become deterministic.
+_NOW = datetime(2025, 6, 1, 12, 0, 0)
+
+
+def create_mock_event(
+    event_id,
+    event_time,
+    ra=None,
+    dec=None,
+    far=None,
+    frequency=None,
+) -> GravitationalWaveEvent:
+    return GravitationalWaveEvent(
+        event_id=event_id,
+        event_time=event_time,
+        far=far,
+        ra=ra,
+        dec=dec,
+        frequency=frequency,
+    )
+
+
+def _batch_validate(preds, events, max_sep_deg=10.0) -> np.ndarray:
+    """(P, E) boolean match matrix via the engine's SoA helpers.
+
+    Windows and separations are evaluated as broadcast array expressions
+    — one kernel call for the whole grid instead of a Python call per
+    (prediction, event) pair.  NaN coordinates (either side unlocated)
+    match on time alone, like the scalar validator.
+    """
+    arrays = predictions_to_arrays(preds)
+    in_window = match_windows(arrays, events_to_arrays(events))
+    m = len(events)
+    event_ra = np.fromiter(
+        (e.ra if e.ra is not None else np.nan for e in events), np.float64, count=m
+    )
+    event_dec = np.fromiter(
+        (e.dec if e.dec is not None else np.nan for e in events), np.float64, count=m
+    )
+    # The compiled kernel wants equal shapes, so expand the broadcast
+    # views up front (no copies beyond the kernel's output).
+    grid = (len(preds), m)
+    sep = haversine_deg(
+        np.broadcast_to(arrays.ra[:, None], grid),
+        np.broadcast_to(arrays.dec[:, None], grid),
+        np.broadcast_to(event_ra[None, :], grid),
+        np.broadcast_to(event_dec[None, :], grid),
+    )
+    return in_window & (np.isnan(sep) | (sep <= max_sep_deg))
+
+
+class TestGravitationalWaveEvent:
+    def test_is_significant_true(self):
+        event = create_mock_event("S1", _NOW, far=1e-9)
+        assert event.is_significant
+
+    def test_is_significant_false(self):
+        event = create_mock_event("S2", _NOW, far=1e-5)
+        assert not event.is_significant
+
+    def test_is_significant_without_far(self):
+        event = create_mock_event("S3", _NOW)
+        assert not event.is_significant
+
+
+class TestSafeFloat:
+    def test_safe_float_valid(self):
+        assert LIGOClient._safe_float("12.5") == 12.5
+        assert LIGOClient._safe_float(3) == 3.0
+
+    def test_safe_float_invalid(self):
+        assert LIGOClient._safe_float(None) is None
+        assert LIGOClient._safe_float("not a number") is None
+        assert LIGOClient._safe_float(["12.5"]) is None
+
+
+class TestLIGOClient:
+    @pytest.fixture(scope="module")
+    def sample_events(self):
+        return (
+            create_mock_event("S1", _NOW - timedelta(hours=72), ra=10.0, dec=5.0),
+            create_mock_event("S2", _NOW - timedelta(hours=36), ra=20.0, dec=-5.0),
+            create_mock_event("S3", _NOW - timedelta(hours=6), ra=30.0, dec=15.0),
+            create_mock_event("S4", _NOW - timedelta(hours=1)),
+        )
+
+    @pytest.fixture(scope="module")
+    def mock_client(self, sample_events):
+        client = LIGOClient()
+        client.set_mock_events(sample_events)
+        return client
+
+    @pytest.mark.parametrize(
+        "kwargs, expected",
+        [
+            ({}, ["S1", "S2", "S3", "S4"]),
+            ({"start": _NOW - timedelta(hours=12)}, ["S3", "S4"]),
+            ({"end": _NOW - timedelta(hours=24)}, ["S1", "S2"]),
+            (
+                {
+                    "start": _NOW - timedelta(hours=48),
+                    "end": _NOW - timedelta(hours=3),
+                },
+                ["S2", "S3"],
+            ),
+            ({"limit": 2}, ["S1", "S2"]),
+        ],
+    )
+    def test_get_superevents_filtered(self, mock_client, kwargs, expected):
+        events = mock_client.get_superevents_sync(**kwargs)
+        assert [e.event_id for e in events] == expected
+
+    def test_multiple_filters_combined(self, mock_client):
+        events = mock_client.get_superevents_sync(
+            start=_NOW - timedelta(hours=40), end=_NOW - timedelta(hours=2), limit=2
+        )
+        assert [e.event_id for e in events] == ["S2", "S3"]
+
+    def test_get_event_by_id(self, mock_client):
+        assert mock_client.get_event_sync("S3").event_id == "S3"
+
+
+_PREDICTION_CONTENT = """\
+# Gravitational Wave Prediction
+
+Prediction ID: GW-2025-0601
+Framework: CIA
+Date: 2025-06-01
+Window: 48 hours
+Confidence: 85
+Frequency: 250 Hz
+Amplitude: 1.2e-21
+RA: 150.5
+Dec: 2.3
+Error radius: 5.0
+Tags: ligo, binary, archive
+"""
+
+
+@pytest.fixture(scope="module")
+def parser():
+    return PredictionParser()
+
+
+@pytest.fixture(scope="module")
+def validator():
+    return PredictionValidator()
+
+
+@pytest.fixture(scope="module")
+def verifier():
+    return HashVerifier()
+
+
+class TestPredictionWorkflow:
+    @pytest.fixture(scope="module")
+    def events(self):
+        return (
+            create_mock_event(
+                "S250601a",
+                datetime(2025, 6, 2, 6),
+                ra=151.0,
+                dec=2.5,
+                frequency=245.0,
+            ),
+            create_mock_event("S250610b", datetime(2025, 6, 10), ra=40.0, dec=-20.0),
+            create_mock_event("S250602c", datetime(2025, 6, 2, 18)),
+        )
+
+    def test_parse_prediction_content(self, parser):
+        prediction = parser.parse_content(_PREDICTION_CONTENT)
+        assert prediction.prediction_id == "GW-2025-0601"
+        assert prediction.prediction_type == PredictionType.GRAVITATIONAL_WAVE
+        assert prediction.framework == PredictionFramework.CIA
+        assert prediction.predicted_event_start == datetime(2025, 6, 1)
+        assert prediction.time_window_hours() == 48.0
+        assert prediction.sky_location == SkyLocation(150.5, 2.3, 5.0)
+        assert prediction.wave_parameters.frequency_hz == 250.0
+        assert prediction.confidence == 85.0
+        assert prediction.tags == ["ligo", "binary", "archive"]
+
+    def test_compute_and_verify_hash(self, parser, verifier):
+        prediction = parser.parse_content(_PREDICTION_CONTENT)
+        first = verifier.compute_prediction_hash(prediction)
+        second = verifier.compute_prediction_hash(prediction)
+        assert first == second
+        assert len(first) == 64
+        assert verifier.verify_prediction_hash(prediction, first)
+
+    def test_fast_file_hash(self, verifier, tmp_path):
+        prediction_file = tmp_path / "prediction.md"
+        prediction_file.write_text(_PREDICTION_CONTENT)
+        fast = verifier.compute_file_hash_fast(prediction_file)
+        assert len(fast) == 64
+        assert fast == verifier.compute_file_hash_fast(prediction_file)
+        assert verifier.verify_file_hash(prediction_file, fast)
+
+    def test_validate_prediction_against_events(self, parser, validator, events):
+        prediction = parser.parse_content(_PREDICTION_CONTENT)
+        best = validator.validate_against_events(prediction, events)
+        assert best is not None
+        assert best.event_id == "S250601a"
+        assert best.matched
+
+    def test_full_workflow_successful_prediction(
+        self, parser, validator, verifier, events, tmp_path
+    ):
+        prediction_file = tmp_path / "prediction.md"
+        prediction_file.write_text(_PREDICTION_CONTENT)
+        prediction = parser.parse_file(prediction_file)
+        assert len(verifier.compute_prediction_hash(prediction)) == 64
+
+        client = LIGOClient()
+        client.set_mock_events(events)
+        window_events = client.get_superevents_sync(
+            start=prediction.predicted_event_start,
+            end=prediction.predicted_event_end,
+        )
+        assert len(window_events) == 2
+
+        best = validator.validate_against_events(prediction, window_events)
+        assert best.matched
+        prediction.mark_validated(best.event_id)
+        assert prediction.validated
+        assert prediction.matched_event_id == "S250601a"
+
+
+class TestMultiplePredictionValidation:
+    @pytest.fixture(scope="module")
+    def predictions(self):
+        return (
+            Prediction(
+                "batch-1",
+                PredictionType.GRAVITATIONAL_WAVE,
+                PredictionFramework.CIA,
+                _NOW - timedelta(hours=24),
+                _NOW + timedelta(hours=24),
+                sky_location=SkyLocation(150.0, 2.0, 5.0),
+            ),
+            Prediction(
+                "batch-2",
+                PredictionType.BLACK_HOLE_MERGER,
+                PredictionFramework.SIA,
+                _NOW + timedelta(hours=48),
+                _NOW + timedelta(hours=96),
+                sky_location=SkyLocation(30.0, -45.0, 5.0),
+            ),
+            Prediction(
+                "batch-3",
+                PredictionType.EARTHQUAKE,
+                PredictionFramework.IIA,
+                _NOW - timedelta(hours=12),
+                _NOW + timedelta(hours=12),
+            ),
+        )
+
+    @pytest.fixture(scope="module")
+    def events(self):
+        return (
+            create_mock_event("E1", _NOW, ra=151.0, dec=2.4),
+            create_mock_event("E2", _NOW + timedelta(hours=72), ra=100.0, dec=50.0),
+            create_mock_event("E3", _NOW - timedelta(hours=6)),
+        )
+
+    def test_batch_validation(self, validator, predictions, events):
+        matches = _batch_validate(predictions, events)
+        assert matches.shape == (3, 3)
+        assert matches.sum(axis=1).tolist() == [2, 0, 2]
+        # Spot-check agreement with the scalar validator.
+        result = validator.validate_against_event(predictions[0], events[0])
+        assert result.matched == bool(matches[0, 0])
+
+    def test_calculate_success_rate(self, predictions, events):
+        matches = _batch_validate(predictions, events)
+        success_rate = matches.any(axis=1).mean()
+        assert success_rate == pytest.approx(2 / 3)
@@ -0,0 +1,292 @@
+"""Unit tests for prediction parsing and the prediction value objects."""
+
+import re
+from dataclasses import replace
+from datetime import datetime, timedelta
+
+import pytest
+
+from prediction_engine import (
+    Prediction,
+    PredictionFramework,
+    PredictionParseError,
+    PredictionParser,
+    PredictionType,
+    SkyLocation,
+    WaveParameters,
+)
+
+
+#: Static parse bodies shared across tests: built once at import instead
+#: of re-evaluating a triple-quoted literal per invocation.
+GW_CONTENT = """\
+Prediction ID: gw-unit-1
+Framework: CIA
+Date: 2026-03-14
+Gravitational wave burst expected; LIGO follow-up advised.
+Confidence: 0.85
+"""
+
+GRB_CONTENT = """\
+Prediction ID: grb-unit-1
+Framework: SIA
+Date: 2026-03-14
+Gamma-ray burst afterglow predicted.
+"""
+
+FLARE_CONTENT = """\
+Prediction ID: flare-unit-1
+Framework: HIA
+Date: 2026-03-14
+Solar flare with coronal mass ejection risk.
+"""
+
+QUAKE_CONTENT = """\
+Prediction ID: eq-unit-1
+Framework: IIA
+Date: 2026-03-14
+Major seismic activity along the tectonic boundary.
+"""
+
+SKY_CONTENT = """\
+Prediction ID: sky-unit-1
+Framework: CIA
+Date: 2026-03-14
+Strain signal expected.
+RA: 210.4
+Dec: -12.5
+Error radius: 3.0
+"""
+
+WAVE_CONTENT = """\
+Prediction ID: wave-unit-1
+Framework: CIA
+Date: 2026-03-14
+Strain amplitude: 1.5e-21
+Frequency: 180 Hz
+Duration: 0.4 seconds
+Chirp mass: 28.1
+"""
+
+#: Compiled once for every pytest.raises site: match= strings are
+#: re.compile'd per assertion otherwise, and the parametrized tables
+#: multiply those call sites.
+RA_MSG = re.compile(r"ra must be in")
+DEC_MSG = re.compile(r"dec must be in")
+RADIUS_MSG = re.compile(r"error_radius must be positive")
+NO_DATE_MSG = re.compile(r"no prediction date")
+
+#: Templates for the parametrized tables; only the varying line is
+#: substituted per case.
+DATE_TEMPLATE = "Prediction ID: date-unit\nFramework: CIA\n{line}\n"
+CONF_TEMPLATE = "Prediction ID: conf-unit\nDate: 2026-03-14\n{line}\n"
+
+
+class TestPredictionParser:
+    #: Module scope: the parser is stateless after construction and its
+    #: patterns are compiled once for every test in the file.
+    @pytest.fixture(scope="module")
+    def parser(self):
+        return PredictionParser()
+
+    @pytest.mark.parametrize(
+        ("content", "prediction_id", "ptype", "framework", "confidence"),
+        [
+            (
+                GW_CONTENT,
+                "gw-unit-1",
+                PredictionType.GRAVITATIONAL_WAVE,
+                PredictionFramework.CIA,
+                0.85,
+            ),
+            (
+                GRB_CONTENT,
+                "grb-unit-1",
+                PredictionType.GAMMA_RAY_BURST,
+                PredictionFramework.SIA,
+                None,
+            ),
+            (
+                FLARE_CONTENT,
+                "flare-unit-1",
+                PredictionType.SOLAR_FLARE,
+                PredictionFramework.HIA,
+                None,
+            ),
+            (
+                QUAKE_CONTENT,
+                "eq-unit-1",
+                PredictionType.EARTHQUAKE,
+                PredictionFramework.IIA,
+                None,
+            ),
+        ],
+    )
+    def test_parse_content_infers_type(
+        self, parser, content, prediction_id, ptype, framework, confidence
+    ):
+        prediction = parser.parse_content(content)
+        assert prediction.prediction_id == prediction_id
+        assert prediction.prediction_type == ptype
+        assert prediction.framework == framework
+        assert prediction.confidence == confidence
+
+    def test_parse_with_sky_location(self, parser):
+        prediction = parser.parse_content(SKY_CONTENT)
+        assert prediction.sky_location == SkyLocation(210.4, -12.5, 3.0)
+
+    def test_parse_wave_parameters(self, parser):
+        prediction = parser.parse_content(WAVE_CONTENT)
+        assert prediction.wave_parameters == WaveParameters(
+            frequency_hz=180.0,
+            amplitude=1.5e-21,
+            duration_seconds=0.4,
+            chirp_mass=28.1,
+        )
+
+    @pytest.mark.parametrize(
+        ("date_line", "expected"),
+        [
+            ("Date: 2025-06-15", datetime(2025, 6, 15)),
+            ("Date: 06/15/2025", datetime(2025, 6, 15)),
+            ("Date: 12-25-2025", datetime(2025, 12, 25)),
+            ("Date: 01/01/25", datetime(2025, 1, 1)),
+            ("Date: 25/12/2025", datetime(2025, 12, 25)),
+        ],
+    )
+    def test_parse_date_formats(self, parser, date_line, expected):
+        prediction = parser.parse_content(DATE_TEMPLATE.format(line=date_line))
+        assert prediction.predicted_event_start == expected
+
+    @pytest.mark.parametrize(
+        ("confidence_line", "expected"),
+        [
+            ("Confidence: 0.7", 0.7),
+            ("Confidence: 85", 85.0),
+            ("Confidence 90%", 90.0),
+            ("confidence: ~0.5", 0.5),
+        ],
+    )
+    def test_parse_confidence_variations(self, parser, confidence_line, expected):
+        prediction = parser.parse_content(CONF_TEMPLATE.format(line=confidence_line))
+        assert prediction.confidence == expected
+
+    def test_parse_missing_date_raises(self, parser):
+        with pytest.raises(PredictionParseError, match=NO_DATE_MSG):
+            parser.parse_content("Prediction ID: undated\nFramework: CIA\n")
+
+    def test_parse_file_not_found(self, parser, tmp_path):
+        with pytest.raises(FileNotFoundError):
+            parser.parse_file(tmp_path / "missing.md")
+
+    def test_default_window(self, parser):
+        prediction = parser.parse_content("Prediction ID: w\nDate: 2026-03-14\n")
+        assert prediction.time_window_hours() == PredictionParser.DEFAULT_WINDOW_HOURS
+
+
+class TestSkyLocation:
+    @pytest.mark.parametrize(
+        ("ra", "dec", "radius", "message"),
+        [
+            (-10.0, 0.0, 1.0, RA_MSG),
+            (400.0, 0.0, 1.0, RA_MSG),
+            (360.0, 0.0, 1.0, RA_MSG),
+            (0.0, -100.0, 1.0, DEC_MSG),
+            (0.0, 95.0, 1.0, DEC_MSG),
+            (0.0, 0.0, -1.0, RADIUS_MSG),
+            (0.0, 0.0, 0.0, RADIUS_MSG),
+        ],
+    )
+    def test_rejects_out_of_range(self, ra, dec, radius, message):
+        with pytest.raises(ValueError, match=message):
+            SkyLocation(ra, dec, radius)
+
+    def test_boundary_values(self):
+        assert SkyLocation(0.0, -90.0, 0.1).ra == 0.0
+        assert SkyLocation(359.9, 90.0, 0.1).dec == 90.0
+
+    def test_default_error_radius(self):
+        assert SkyLocation(10.0, 10.0).error_radius == 10.0
+
+
+class TestWaveParameters:
+    def test_defaults_are_none(self):
+        wave = WaveParameters()
+        assert wave.frequency_hz is None
+        assert wave.amplitude is None
+        assert wave.duration_seconds is None
+        assert wave.chirp_mass is None
+
+
+class TestPrediction:
+    #: Frozen clock: window assertions are exact and no test drifts from
+    #: the instant its fixture was built.
+    @pytest.fixture(scope="module")
+    def now(self):
+        return datetime(2025, 1, 1, 12, 0, 0)
+
+    #: Built once per module; read-only tests take this directly, tests
+    #: that mutate take sample_prediction, a fresh copy.
+    @pytest.fixture(scope="module")
+    def base_prediction(self, now):
+        return Prediction(
+            prediction_id="unit-sample",
+            prediction_type=PredictionType.GRAVITATIONAL_WAVE,
+            framework=PredictionFramework.CIA,
+            predicted_event_start=now - timedelta(hours=12),
+            predicted_event_end=now + timedelta(hours=12),
+            sky_location=SkyLocation(150.0, 2.0, 5.0),
+            confidence=0.8,
+        )
+
+    @pytest.fixture
+    def sample_prediction(self, base_prediction):
+        return replace(base_prediction)
+
+    def test_time_window_hours(self, base_prediction):
+        assert base_prediction.time_window_hours() == 24.0
+
+    def test_is_within_window(self, base_prediction, now):
+        assert base_prediction.is_within_window(now + timedelta(hours=5))
+        assert not base_prediction.is_within_window(now + timedelta(hours=48))
+
+    def test_mark_validated(self, sample_prediction):
+        sample_prediction.mark_validated("S260314a", notes="matched in window")
+        assert sample_prediction.validated
+        assert sample_prediction.matched_event_id == "S260314a"
+        assert sample_prediction.validation_notes == "matched in window"
+
+    def test_prediction_with_optional_fields(self, now):
+        prediction = Prediction(
+            prediction_id="bare",
+            prediction_type=PredictionType.EARTHQUAKE,
+            framework=PredictionFramework.EXPERIMENTAL,
+            predicted_event_start=now,
+            predicted_event_end=now + timedelta(hours=1),
+        )
+        assert prediction.sky_location is None
+        assert prediction.wave_parameters is None
+        assert prediction.confidence is None
+        assert prediction.tags == []
+
+    @pytest.mark.parametrize("pred_type", list(PredictionType))
+    def test_all_prediction_types(self, now, pred_type):
+        prediction = Prediction(
+            prediction_id=f"type-{pred_type.value}",
+            prediction_type=pred_type,
+            framework=PredictionFramework.CIA,
+            predicted_event_start=now,
+            predicted_event_end=now + timedelta(hours=1),
+        )
+        assert prediction.prediction_type == pred_type
+
+    @pytest.mark.parametrize("framework", list(PredictionFramework))
+    def test_all_frameworks(self, now, framework):
+        prediction = Prediction(
+            prediction_id=f"fw-{framework.value}",
+            prediction_type=PredictionType.GRAVITATIONAL_WAVE,
+            framework=framework,
+            predicted_event_start=now,
+            predicted_event_end=now + timedelta(hours=1),
+        )
+        assert prediction.framework == framework
@@ -0,0 +1,115 @@
+"""Unit tests for the transliterator front door and CLI plumbing."""
+
+import pytest
+
+from transliterator import Transliterator, UnsupportedFormatError, WebConverter
+from transliterator.cli import main
+
+
+class TestTransliterator:
+    #: Module scope: the registry is immutable after construction.
+    @pytest.fixture(scope="module")
+    def transliterator(self):
+        return Transliterator()
+
+    def test_supported_formats_cover_office_and_images(self, transliterator):
+        formats = transliterator.supported_formats()
+        assert {".docx", ".xlsx", ".png"} <= set(formats)
+
+    def test_unsupported_extension_raises(self, transliterator, tmp_path):
+        stray = tmp_path / "notes.xyz"
+        stray.write_text("plain text")
+        with pytest.raises(UnsupportedFormatError, match=r"\.xyz"):
+            transliterator.convert(stray)
+
+    def test_missing_file_raises(self, transliterator, tmp_path):
+        with pytest.raises(FileNotFoundError):
+            transliterator.convert(tmp_path / "missing.docx")
+
+    def test_convert_file_skips_current_output(self, transliterator, tmp_path):
+        source = tmp_path / "doc.docx"
+        source.write_bytes(b"not really a docx")
+        out_dir = tmp_path / "out"
+        out_dir.mkdir()
+        out_path = out_dir / "doc.md"
+        out_path.write_text("cached output")
+        # Output is newer than the source, so the bogus payload is
+        # never parsed.
+        assert transliterator.convert_file(source, out_dir) == out_path
+        assert out_path.read_text() == "cached output"
+
+    def test_convert_directory_skips_unsupported(self, transliterator, tmp_path):
+        (tmp_path / "notes.txt").write_text("plain text")
+        written = transliterator.convert_directory(tmp_path, tmp_path / "out")
+        assert written == []
+
+
+class TestMarkdownCache:
+    @pytest.fixture(autouse=True)
+    def cache_dir(self, tmp_path, monkeypatch):
+        from transliterator.converters import _cache
+
+        monkeypatch.setattr(_cache, "_CACHE_DIR", tmp_path / "cache")
+        return _cache
+
+    def test_roundtrip(self, cache_dir):
+        key = cache_dir.hash_bytes(b"page body")
+        assert cache_dir.get(key) is None
+        cache_dir.put(key, "# Converted\n", source="https://example.com")
+        assert cache_dir.get(key) == "# Converted\n"
+        assert cache_dir.get_meta(key)["source"] == "https://example.com"
+
+    def test_version_skew_misses(self, cache_dir):
+        key = cache_dir.hash_bytes(b"stale")
+        cache_dir.put(key, "old layout")
+        cache_dir.put_meta(key, {"version": -1})
+        # put_meta stamps the current version over the caller's value.
+        assert cache_dir.get(key) == "old layout"
+        cache_dir._meta_path(key).write_text('{"version": 0}')
+        assert cache_dir.get(key) is None
+
+
+class TestWebConverter:
+    @pytest.mark.parametrize(
+        ("url", "expected"),
+        [
+            ("https://corp.sharepoint.com/sites/x", True),
+            ("https://agency.sharepoint.us/pages/y", True),
+            ("https://example.com/sharepoint.com.html", False),
+        ],
+    )
+    def test_is_sharepoint(self, url, expected):
+        assert WebConverter.is_sharepoint(url) is expected
+
+    def test_url_to_filename_is_filesystem_safe(self):
+        name = WebConverter._url_to_filename(
+            "https://example.com/a/b?query=1&x=2"
+        )
+        assert "/" not in name
+        assert "?" not in name
+        assert name.startswith("example.com_a_b")
+
+    def test_postprocess_caps_blank_runs(self):
+        md = "one\n\n\n\n\nline two\n"
+        out = WebConverter._postprocess(md, "https://example.com", "Title")
+        assert out.startswith("---\nsource: https://example.com\ntitle: Title\n---\n")
+        assert "\n\n\n\n" not in out
+        assert out.endswith("line two\n")
+
+
+class TestCLI:
+    def test_formats_flag_lists_extensions(self, capsys):
+        assert main(["--formats"]) == 0
+        out = capsys.readouterr().out
+        assert ".docx" in out
+        assert ".png" in out
+
+    def test_missing_source_reports_error(self, tmp_path, capsys):
+        missing = tmp_path / "missing.docx"
+        assert main([str(missing), "--output", str(tmp_path / "out")]) == 1
+        assert "error" in capsys.readouterr().err
+
+    def test_multiple_sources_report_every_error(self, tmp_path, capsys):
+        sources = [str(tmp_path / name) for name in ("a.docx", "b.xlsx")]
+        assert main([*sources, "--output", str(tmp_path / "out")]) == 1
+        assert capsys.readouterr().err.count("error") == 2